@@ -92,23 +92,27 @@ def split_qa(text):
 # -----------------------------
 # MAIN
 # -----------------------------
-full_text = ""
+def main():
+    full_text = ""
 
-for file in os.listdir(IMAGE_FOLDER):
-    if file.lower().endswith((".png", ".jpg", ".jpeg")):
-        print("Processing:", file)
-        text = ocr_image(os.path.join(IMAGE_FOLDER, file))
-        full_text += text + "\n"
+    for file in os.listdir(IMAGE_FOLDER):
+        if file.lower().endswith((".png", ".jpg", ".jpeg")):
+            print("Processing:", file)
+            text = ocr_image(os.path.join(IMAGE_FOLDER, file))
+            full_text += text + "\n"
 
-# Save raw OCR (for proof)
-with open(os.path.join(OUTPUT_FOLDER, "raw_text.txt"), "w", encoding="utf-8") as f:
-    f.write(full_text)
+    # Save raw OCR (for proof)
+    with open(os.path.join(OUTPUT_FOLDER, "raw_text.txt"), "w", encoding="utf-8") as f:
+        f.write(full_text)
 
-qa_pairs = split_qa(full_text)
+    qa_pairs = split_qa(full_text)
 
-with open(os.path.join(OUTPUT_FOLDER, "qa_pairs.txt"), "w", encoding="utf-8") as f:
-    for i, (q, a) in enumerate(qa_pairs, 1):
-        f.write(f"Q{i}: {q}\n")
-        f.write(f"A{i}: {a}\n\n")
+    with open(os.path.join(OUTPUT_FOLDER, "qa_pairs.txt"), "w", encoding="utf-8") as f:
+        for i, (q, a) in enumerate(qa_pairs, 1):
+            f.write(f"Q{i}: {q}\n")
+            f.write(f"A{i}: {a}\n\n")
 
-print("Done")
+    print("Done")
+
+if __name__ == "__main__":
+    main()
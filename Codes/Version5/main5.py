@@ -39,10 +39,12 @@ def ocr_image(image_path):
 
     config = "--oem 3 --psm 6 -c preserve_interword_spaces=1"
     text = pytesseract.image_to_string(thresh, config=config)
-    
-    # -----------------------------
-    # Clean OCR text
-    # -----------------------------
+    return clean_text(text)
+
+# -----------------------------
+# Clean OCR text
+# -----------------------------
+def clean_text(text):
     text = text.replace("\n", " ")        # merge lines
     text = re.sub(r"\s+", " ", text)     # collapse multiple spaces
     text = re.sub(r"([.?!])", r"\1\n", text)  # put sentences on new lines
@@ -75,26 +77,30 @@ def split_qa(text):
 # -----------------------------
 # 5️⃣ Process all images
 # -----------------------------
-all_text = ""
-for filename in sorted(os.listdir(IMAGE_FOLDER)):
-    if filename.lower().endswith((".png", ".jpg", ".jpeg")):
-        img_path = os.path.join(IMAGE_FOLDER, filename)
-        print(f"Processing: {filename}")
-        text = ocr_image(img_path)
-        all_text += text + "\n"
+def main():
+    all_text = ""
+    for filename in sorted(os.listdir(IMAGE_FOLDER)):
+        if filename.lower().endswith((".png", ".jpg", ".jpeg")):
+            img_path = os.path.join(IMAGE_FOLDER, filename)
+            print(f"Processing: {filename}")
+            text = ocr_image(img_path)
+            all_text += text + "\n"
 
-# -----------------------------
-# 6️⃣ Extract Q&A pairs
-# -----------------------------
-qa_pairs = split_qa(all_text)
+    # -----------------------------
+    # 6️⃣ Extract Q&A pairs
+    # -----------------------------
+    qa_pairs = split_qa(all_text)
 
-# -----------------------------
-# 7️⃣ Save to text file
-# -----------------------------
-output_path = os.path.join(OUTPUT_FOLDER, "final_qa_clean.txt")
-with open(output_path, "w", encoding="utf-8") as f:
-    for i, (q, a) in enumerate(qa_pairs, 1):
-        f.write(f"Q{i}: {q}\n")
-        f.write(f"A{i}: {a}\n\n")
+    # -----------------------------
+    # 7️⃣ Save to text file
+    # -----------------------------
+    output_path = os.path.join(OUTPUT_FOLDER, "final_qa_clean.txt")
+    with open(output_path, "w", encoding="utf-8") as f:
+        for i, (q, a) in enumerate(qa_pairs, 1):
+            f.write(f"Q{i}: {q}\n")
+            f.write(f"A{i}: {a}\n\n")
+
+    print(f"✅ Done! Clean QA pairs saved at {output_path}")
 
-print(f"✅ Done! Clean QA pairs saved at {output_path}")
+if __name__ == "__main__":
+    main()
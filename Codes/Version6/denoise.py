@@ -0,0 +1,160 @@
+import cv2
+import numpy as np
+import os
+import time
+import difflib
+
+# ==============================
+# DENOISERS
+# ==============================
+# Every denoiser takes the CLAHE-enhanced grayscale page (uint8) and
+# returns an edge-preserved uint8 page of the same size, so they can be
+# swapped into preprocess_image without touching the other stages.
+
+def bilateral(gray):
+    # Reference filter used by preprocess_image
+    return cv2.bilateralFilter(gray, 9, 75, 75)
+
+def downsampled_bilateral(gray, scale=0.5):
+    """
+    Bilateral filter at reduced resolution, upsampled back.
+    Work drops with scale squared; the spatial sigma shrinks with the image.
+    """
+    h, w = gray.shape
+    small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    small = cv2.bilateralFilter(small, max(3, int(9 * scale) | 1), 75, 75 * scale)
+    return cv2.resize(small, (w, h), interpolation=cv2.INTER_LINEAR)
+
+def guided(gray, radius=4, eps=0.02, subsample=2):
+    """
+    Self-guided filter (He et al.) built from box filters only, so its
+    cost does not depend on the radius. The linear coefficients are
+    fitted on a subsampled page and upsampled (fast guided filter).
+    """
+    h, w = gray.shape
+    I = gray.astype(np.float32) / 255
+    small = cv2.resize(I, None, fx=1 / subsample, fy=1 / subsample, interpolation=cv2.INTER_AREA)
+    r = max(1, radius // subsample)
+    size = (2 * r + 1, 2 * r + 1)
+
+    mean_I = cv2.boxFilter(small, -1, size)
+    var_I = cv2.boxFilter(small * small, -1, size) - mean_I * mean_I
+
+    a = var_I / (var_I + eps)
+    b = mean_I - a * mean_I
+
+    mean_a = cv2.resize(cv2.boxFilter(a, -1, size), (w, h), interpolation=cv2.INTER_LINEAR)
+    mean_b = cv2.resize(cv2.boxFilter(b, -1, size), (w, h), interpolation=cv2.INTER_LINEAR)
+    return np.clip((mean_a * I + mean_b) * 255, 0, 255).astype(np.uint8)
+
+def recursive(gray, sigma_s=9, sigma_r=75, iterations=1):
+    """
+    Domain-transform recursive filter (Gastal & Oliveira): separable
+    horizontal/vertical sweeps whose decay grows across strong edges.
+    Each iteration is one full pair of sweeps; a single pass leaves faint
+    streaks along the sweep direction but is what makes it faster than
+    bilateral. Needs opencv-contrib-python for cv2.ximgproc.
+    """
+    return cv2.ximgproc.dtFilter(
+        gray, gray, sigma_s, sigma_r,
+        mode=cv2.ximgproc.DTF_RF, numIters=iterations
+    )
+
+DENOISERS = {
+    "bilateral": bilateral,
+    "downsampled_bilateral": downsampled_bilateral,
+    "guided": guided,
+}
+
+# The recursive sweeps are only fast in OpenCV's C++ implementation;
+# plain opencv-python has no ximgproc, so the filter is not offered there
+if hasattr(cv2, "ximgproc"):
+    DENOISERS["recursive"] = recursive
+
+# ==============================
+# BENCHMARK
+# ==============================
+def time_per_megapixel(denoiser, gray, repeats=3):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        denoiser(gray)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / (gray.size / 1e6)
+
+def text_similarity(a, b):
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+def benchmark_denoisers(img_paths, preprocess, recognise, clahe_gray):
+    """
+    For every denoiser: seconds per megapixel, and OCR similarity to a
+    reference. The reference is a ground-truth <image>.txt next to the
+    image when present, otherwise the bilateral filter's own OCR text.
+    """
+    results = {name: {"sec_per_mp": [], "accuracy": []} for name in DENOISERS}
+
+    for img_path in img_paths:
+        gray = clahe_gray(img_path)
+        if gray is None:
+            continue
+
+        truth_path = os.path.splitext(img_path)[0] + ".txt"
+        truth = None
+        if os.path.exists(truth_path):
+            with open(truth_path, "r", encoding="utf-8") as f:
+                truth = f.read()
+
+        texts = {}
+        for name, denoiser in DENOISERS.items():
+            results[name]["sec_per_mp"].append(time_per_megapixel(denoiser, gray))
+            texts[name] = recognise(preprocess(img_path, denoise=name))
+
+        reference = truth if truth is not None else texts["bilateral"]
+        for name in DENOISERS:
+            results[name]["accuracy"].append(text_similarity(texts[name], reference))
+
+    report = []
+    for name, r in results.items():
+        if not r["sec_per_mp"]:
+            continue
+        report.append({
+            "denoiser": name,
+            "sec_per_mp": sum(r["sec_per_mp"]) / len(r["sec_per_mp"]),
+            "accuracy": sum(r["accuracy"]) / len(r["accuracy"]),
+        })
+
+    if not report:
+        return report
+
+    baseline = next(r for r in report if r["denoiser"] == "bilateral")
+    for r in report:
+        r["speedup"] = baseline["sec_per_mp"] / r["sec_per_mp"]
+        r["accuracy_delta"] = r["accuracy"] - baseline["accuracy"]
+
+    return report
+
+# ==============================
+# MAIN FUNCTION
+# ==============================
+def main():
+    import main6
+
+    img_paths = [
+        os.path.join(main6.IMAGE_FOLDER, file)
+        for file in sorted(os.listdir(main6.IMAGE_FOLDER))
+        if file.lower().endswith((".png", ".jpg", ".jpeg"))
+    ]
+    report = benchmark_denoisers(
+        img_paths, main6.preprocess_image, main6.recognise_text, main6.clahe_gray
+    )
+
+    print(f"{'Denoiser':<24}{'s/MP':>8}{'Speedup':>10}{'Accuracy':>10}{'Δ':>8}")
+    for r in report:
+        print(
+            f"{r['denoiser']:<24}{r['sec_per_mp']:>8.3f}{r['speedup']:>9.1f}x"
+            f"{r['accuracy']:>10.3f}{r['accuracy_delta']:>+8.3f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import re
+
+# ==============================
+# OCR CONFUSION MAPS
+# ==============================
+# Digits and symbols OCR reads in place of letters. Applied first, and
+# on their own before the real-word check, so "N0w" is still "now".
+SYMBOL_CONFUSIONS = (
+    ("1", "l"),
+    ("|", "l"),
+    ("!", "l"),
+    ("0", "o"),
+    ("5", "s"),
+)
+
+# Letter sequences handwriting OCR swaps so often that they are mapped
+# to one canonical form on both sides and cost nothing
+LETTER_CONFUSIONS = (
+    ("rn", "m"),
+    ("vv", "w"),
+    ("cl", "d"),
+    ("i", "l"),
+    ("n", "h"),
+    ("u", "v"),
+)
+
+# Rarer misreads (as written -> as OCR'd). Each use costs one edit of the
+# max_distance budget. Only these edits are allowed: arbitrary edits let
+# real words through ("Stage" -> "state", "Decline" -> "define").
+OCR_MISREADS = (
+    ("ri", "n"),
+    ("in", "m"),
+    ("b", "h"),
+    ("h", "b"),
+    ("e", "c"),
+    ("c", "e"),
+    ("a", "o"),
+    ("o", "a"),
+    ("t", "f"),
+    ("f", "t"),
+    ("g", "q"),
+)
+
+# Real words that normalise onto a keyword but start answers, e.g.
+# "Now ..." -> "how", "Glue ..." -> "glve" (the canonical form of "give")
+REAL_WORDS = frozenset({"now", "glue"})
+
+# Shorter words get only the free confusions: one misread turns "how" into "bow"
+MIN_MISREAD_LENGTH = 4
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9|!]+")
+
+# Lookups are cached per first word; cleared when it grows past this
+CACHE_SIZE = 10000
+
+# ==============================
+# NORMALISATION
+# ==============================
+def normalise(token):
+    for wrong, right in SYMBOL_CONFUSIONS + LETTER_CONFUSIONS:
+        token = token.replace(wrong, right)
+    return token
+
+def normalise_symbols(token):
+    for wrong, right in SYMBOL_CONFUSIONS:
+        token = token.replace(wrong, right)
+    return token
+
+def _misread_variants(word):
+    # Every spelling one misread away from word
+    variants = set()
+    for written, read in OCR_MISREADS:
+        start = word.find(written)
+        while start != -1:
+            variants.add(word[:start] + read + word[start + len(written):])
+            start = word.find(written, start + 1)
+    return variants
+
+# ==============================
+# MISREAD INDEX
+# ==============================
+def build_keyword_index(keywords, max_distance=1, exclude=REAL_WORDS):
+    """
+    Maps every normalised spelling within max_distance misreads of a
+    keyword to (keyword, misreads). Built breadth-first, so each
+    spelling keeps its cheapest keyword, and a lookup is one dict hit.
+    """
+    variants = {}
+    for keyword in keywords:
+        frontier = {keyword.lower()}
+        for distance in range(max_distance + 1):
+            for word in frontier:
+                canonical = normalise(word)
+                if canonical not in variants or variants[canonical][1] > distance:
+                    variants[canonical] = (keyword, distance)
+            frontier = {v for word in frontier for v in _misread_variants(word)}
+
+    return {
+        "keywords": tuple(k.lower() for k in keywords),
+        "exclude": frozenset(exclude),
+        "variants": variants,
+        "cache": {},
+    }
+
+def _lookup(token, index):
+    if normalise_symbols(token) in index["exclude"]:
+        return None
+
+    canonical = normalise(token)
+    match = index["variants"].get(canonical)
+    if match is None:
+        return None
+
+    keyword, distance = match
+    if distance > 0 and len(canonical) < MIN_MISREAD_LENGTH:
+        return None
+    return keyword
+
+def match_keyword(line, index):
+    """
+    Returns the question keyword the line starts with, tolerating OCR
+    misreads in the first word, or None.
+    """
+    lower_line = line.lower()
+
+    # Exact prefixes keep the original startswith behaviour and cost
+    if lower_line.startswith(index["keywords"]):
+        for keyword in index["keywords"]:
+            if lower_line.startswith(keyword):
+                return keyword
+
+    token = TOKEN_PATTERN.match(lower_line)
+    if token is None:
+        return None
+    token = token.group()
+
+    cache = index["cache"]
+    if token not in cache:
+        if len(cache) >= CACHE_SIZE:
+            cache.clear()
+        cache[token] = _lookup(token, index)
+    return cache[token]
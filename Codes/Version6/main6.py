@@ -4,6 +4,10 @@ import numpy as np
 import os
 import re
 
+from denoise import DENOISERS
+from fuzzy_keywords import build_keyword_index, match_keyword
+from scheduler import ocr_pages
+
 # ==============================
 # PATHS
 # ==============================
@@ -20,7 +24,11 @@ os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 # ==============================
 # IMAGE PREPROCESSING
 # ==============================
-def preprocess_image(img_path):
+# Edge-preserving denoiser from denoise.DENOISERS; "bilateral" is the
+# most accurate, the others trade a little accuracy for speed
+DENOISER = "bilateral"
+
+def clahe_gray(img_path):
     img = cv2.imread(img_path)
 
     if img is None:
@@ -32,10 +40,17 @@ def preprocess_image(img_path):
 
     # CLAHE for contrast enhancement
     clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-    gray = clahe.apply(gray)
+    return clahe.apply(gray)
 
-    # Bilateral filter to remove noise but preserve edges
-    gray = cv2.bilateralFilter(gray, 9, 75, 75)
+def preprocess_image(img_path, denoise=None):
+    gray = clahe_gray(img_path)
+    if gray is None:
+        return None
+
+    # Remove noise but preserve edges. DENOISER is read per call, but pool
+    # workers started with spawn (the Windows default) re-import this module
+    # and see the default above, so other scripts pass denoise to ocr_pages
+    gray = DENOISERS[denoise or DENOISER](gray)
 
     # Resize for better OCR
     gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
@@ -57,13 +72,18 @@ def preprocess_image(img_path):
 # ==============================
 # OCR FUNCTION
 # ==============================
-def ocr_image(img_path):
-    processed = preprocess_image(img_path)
+OCR_CONFIG = "--oem 3 --psm 6"
+
+def ocr_image(img_path, denoise=None):
+    processed = preprocess_image(img_path, denoise)
     if processed is None:
         return ""
 
+    return recognise_text(processed)
+
+def recognise_text(processed):
     # Use line-wise OCR to preserve formatting
-    data = pytesseract.image_to_data(processed, config="--oem 3 --psm 6", output_type=pytesseract.Output.DICT)
+    data = pytesseract.image_to_data(processed, config=OCR_CONFIG, output_type=pytesseract.Output.DICT)
     lines = {}
     for i, text in enumerate(data['text']):
         text = text.strip()
@@ -80,18 +100,23 @@ def ocr_image(img_path):
 # ==============================
 # QA SEPARATION FUNCTION
 # ==============================
+QUESTION_KEYWORDS = (
+    "what", "why", "how", "define", "explain",
+    "state", "list", "describe", "give", "write"
+)
+
+# Max OCR misreads (ri/n, b/h, e/c, ...) allowed in a keyword, on top of
+# the free confusions that already fix "Exp1ain" and "Wnat"
+MAX_KEYWORD_DISTANCE = 1
+KEYWORD_INDEX = build_keyword_index(QUESTION_KEYWORDS, MAX_KEYWORD_DISTANCE)
+
 def split_qa(text):
     lines = [line.strip() for line in text.split("\n") if line.strip()]
-    QUESTION_KEYWORDS = (
-        "what", "why", "how", "define", "explain",
-        "state", "list", "describe", "give", "write"
-    )
     qa_pairs = []
     current_question = None
     current_answer = []
 
     for line in lines:
-        lower_line = line.lower()
         is_question = False
         is_option = False
 
@@ -100,7 +125,7 @@ def split_qa(text):
             is_option = True
 
         # Detect questions
-        if line.endswith("?") or any(lower_line.startswith(k) for k in QUESTION_KEYWORDS) or re.match(r"^\d+\.", line):
+        if line.endswith("?") or match_keyword(line, KEYWORD_INDEX) or re.match(r"^\d+\.", line):
             is_question = True
 
         if is_question:
@@ -144,12 +169,15 @@ def split_qa(text):
 def main():
     full_text = ""
 
-    # OCR all images
-    for file in sorted(os.listdir(IMAGE_FOLDER)):
-        if file.lower().endswith((".png", ".jpg", ".jpeg")):
-            print(f"Processing: {file}")
-            text = ocr_image(os.path.join(IMAGE_FOLDER, file))
-            full_text += text + "\n"
+    # OCR all images, spread across workers sized to the machine
+    files = [
+        file for file in sorted(os.listdir(IMAGE_FOLDER))
+        if file.lower().endswith((".png", ".jpg", ".jpeg"))
+    ]
+    img_paths = [os.path.join(IMAGE_FOLDER, file) for file in files]
+    texts = ocr_pages(img_paths, preprocess_image, recognise_text, ocr_image, denoise=DENOISER)
+    for text in texts:
+        full_text += text + "\n"
 
     # Save raw OCR text
     with open(RAW_TEXT_FILE, "w", encoding="utf-8") as f:
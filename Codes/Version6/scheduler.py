@@ -0,0 +1,263 @@
+import os
+import time
+from contextlib import contextmanager
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import cv2
+
+# ==============================
+# TUNING CONSTANTS
+# ==============================
+# Peak bytes held per page, as a multiple of the preprocessed image size.
+# preprocess_image keeps ~4.5x (BGR + gray copies at 1x, resize/sharpen/
+# threshold at 2x) and Tesseract's own buffers take roughly the same again.
+PAGE_MEMORY_FACTOR = 10
+
+# Rough cost of starting one worker process (imports cv2 + pytesseract)
+POOL_STARTUP_SECONDS = 0.5
+
+# Extra pages queued per worker so no worker idles between tasks
+QUEUE_DEPTH_PER_WORKER = 1
+
+# Values above this in cgroup v1 memory.limit_in_bytes mean "no limit"
+UNLIMITED_MEMORY = 1 << 60
+
+# ==============================
+# RESOURCE DETECTION
+# ==============================
+def _read_first_line(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+def cgroup_cpu_limit():
+    # cgroup v2: "max 100000" or "<quota> <period>"
+    line = _read_first_line("/sys/fs/cgroup/cpu.max")
+    if line:
+        quota, period = line.split()[:2]
+        if quota == "max":
+            return None
+        return max(1, int(quota) // int(period))
+
+    # cgroup v1: quota of -1 means unlimited
+    quota = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+    period = _read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+    if quota and period and int(quota) > 0:
+        return max(1, int(quota) // int(period))
+    return None
+
+def cgroup_memory_limit():
+    line = _read_first_line("/sys/fs/cgroup/memory.max")
+    if line is None:
+        line = _read_first_line("/sys/fs/cgroup/memory/memory.limit_in_bytes")
+    if not line or line == "max" or int(line) >= UNLIMITED_MEMORY:
+        return None
+    return int(line)
+
+def available_memory():
+    """
+    Bytes that can still be allocated, or None when unknown
+    (e.g. on Windows, where neither /proc nor cgroups exist).
+    """
+    candidates = []
+
+    limit = cgroup_memory_limit()
+    if limit is not None:
+        usage = _read_first_line("/sys/fs/cgroup/memory.current")
+        if usage is None:
+            usage = _read_first_line("/sys/fs/cgroup/memory/memory.usage_in_bytes")
+        candidates.append(limit - int(usage or 0))
+
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    candidates.append(int(line.split()[1]) * 1024)
+                    break
+    except OSError:
+        pass
+
+    if not candidates:
+        return None
+    return max(0, min(candidates))
+
+def detect_resources():
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+
+    return {"cpus": cpus, "memory": available_memory()}
+
+# ==============================
+# STAGE COST MEASUREMENT
+# ==============================
+def measure_stage_costs(img_path, preprocess, recognise):
+    """
+    Runs one page through both stages, timing each.
+    Returns (costs, text) so the calibration page is not OCR'd twice.
+    """
+    start = time.perf_counter()
+    processed = preprocess(img_path)
+    preprocessed = time.perf_counter()
+    if processed is None:
+        return None, ""
+
+    text = recognise(processed)
+    finished = time.perf_counter()
+
+    costs = {
+        "preprocess": preprocessed - start,
+        "ocr": finished - preprocessed,
+        "page_bytes": processed.size * PAGE_MEMORY_FACTOR,
+    }
+    return costs, text
+
+# ==============================
+# SCHEDULE PLANNING
+# ==============================
+def plan_schedule(resources, costs, num_pages):
+    """
+    Picks worker count and per-worker thread limits.
+
+    Whole pages in parallel scale almost linearly, while OpenCV's and
+    Tesseract's internal threads do not, so cores go to workers first and
+    only the cores left over (when memory or page count caps the workers)
+    are handed to the stage that dominates the measured page time.
+    """
+    cpus = resources["cpus"]
+    workers = max(1, min(cpus, num_pages))
+
+    if costs is not None:
+        if resources["memory"] is not None:
+            workers = min(workers, max(1, resources["memory"] // costs["page_bytes"]))
+
+        # Not worth starting a pool for a handful of quick pages
+        serial_time = (costs["preprocess"] + costs["ocr"]) * num_pages
+        if serial_time < POOL_STARTUP_SECONDS * workers:
+            workers = 1
+
+    spare = max(1, cpus // workers)
+    cv_threads = spare
+    omp_threads = 1
+    if costs is not None and costs["ocr"] > costs["preprocess"]:
+        omp_threads = spare
+
+    return {
+        "workers": workers,
+        "cv_threads": cv_threads,
+        "omp_threads": omp_threads,
+        "page_bytes": costs["page_bytes"] if costs is not None else None,
+    }
+
+def in_flight_window(plan, in_flight=0):
+    """
+    How many pages may be queued right now: enough to keep every worker
+    fed, shrunk when free memory would not hold that many pages at once.
+    Free memory is measured with the in_flight pages already allocated,
+    so it limits only the pages added on top of them.
+    """
+    window = plan["workers"] * (1 + QUEUE_DEPTH_PER_WORKER)
+    if plan["page_bytes"]:
+        memory = available_memory()
+        if memory is not None:
+            window = min(window, max(1, in_flight + memory // plan["page_bytes"]))
+    return window
+
+# ==============================
+# WORKERS
+# ==============================
+def limit_threads(cv_threads, omp_threads):
+    # Tesseract runs as a subprocess and inherits this from our environment
+    os.environ["OMP_THREAD_LIMIT"] = str(omp_threads)
+    cv2.setNumThreads(cv_threads)
+
+@contextmanager
+def limited_threads(cv_threads, omp_threads):
+    # For the serial path, which runs in the caller's process: put the
+    # caller's thread settings back once its pages are done
+    previous_cv = cv2.getNumThreads()
+    previous_omp = os.environ.get("OMP_THREAD_LIMIT")
+    limit_threads(cv_threads, omp_threads)
+    try:
+        yield
+    finally:
+        cv2.setNumThreads(previous_cv)
+        if previous_omp is None:
+            os.environ.pop("OMP_THREAD_LIMIT", None)
+        else:
+            os.environ["OMP_THREAD_LIMIT"] = previous_omp
+
+def report_progress(img_path, done, total):
+    print(f"Processed: {os.path.basename(img_path)} ({done}/{total})")
+
+def run_pages(img_paths, ocr, plan, done=0, total=None):
+    total = total or len(img_paths)
+    texts = [""] * len(img_paths)
+
+    with ProcessPoolExecutor(
+        max_workers=plan["workers"],
+        initializer=limit_threads,
+        initargs=(plan["cv_threads"], plan["omp_threads"]),
+    ) as pool:
+        pending = {}
+        next_index = 0
+
+        while next_index < len(img_paths) or pending:
+            # Re-check memory on every round so the queue shrinks under pressure
+            window = in_flight_window(plan, len(pending))
+            while next_index < len(img_paths) and len(pending) < window:
+                future = pool.submit(ocr, img_paths[next_index])
+                pending[future] = next_index
+                next_index += 1
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = pending.pop(future)
+                texts[index] = future.result()
+                done += 1
+                report_progress(img_paths[index], done, total)
+
+    return texts
+
+def ocr_pages(img_paths, preprocess, recognise, ocr, denoise=None):
+    """
+    OCRs every page, returning texts in input order.
+    The first page calibrates the stage costs used to size the pool.
+    denoise is passed to preprocess and ocr explicitly: workers started
+    with spawn re-import their modules and would not see a changed default.
+    """
+    if not img_paths:
+        return []
+
+    if denoise is not None:
+        preprocess = partial(preprocess, denoise=denoise)
+        ocr = partial(ocr, denoise=denoise)
+
+    resources = detect_resources()
+    costs, first_text = measure_stage_costs(img_paths[0], preprocess, recognise)
+    report_progress(img_paths[0], 1, len(img_paths))
+    rest = img_paths[1:]
+    plan = plan_schedule(resources, costs, len(rest))
+
+    print(
+        f"⚙️ {resources['cpus']} CPUs: {plan['workers']} worker(s), "
+        f"{plan['cv_threads']} OpenCV thread(s), {plan['omp_threads']} Tesseract thread(s)"
+    )
+
+    if plan["workers"] == 1:
+        texts = [first_text]
+        with limited_threads(plan["cv_threads"], plan["omp_threads"]):
+            for img_path in rest:
+                texts.append(ocr(img_path))
+                report_progress(img_path, len(texts), len(img_paths))
+        return texts
+
+    return [first_text] + run_pages(rest, ocr, plan, done=1, total=len(img_paths))
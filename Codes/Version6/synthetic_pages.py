@@ -0,0 +1,332 @@
+import cv2
+import numpy as np
+import os
+import json
+import time
+import difflib
+import re
+
+# ==============================
+# CONFIGURATION
+# ==============================
+SYNTHETIC_FOLDER = r"C:\Users\VGMan\Downloads\Handwritten_OCR_QA\synthetic"
+PAGE_COUNT = 100
+PAGE_SIZE = (1240, 1754)  # width, height: A4 at 150 DPI
+SEED = 0
+
+# Run preprocess_image -> ocr_image -> split_qa over the corpus after generating
+RUN_PIPELINE = True
+
+# ==============================
+# CONTENT
+# ==============================
+TOPICS = (
+    "photosynthesis", "the water cycle", "gravity", "osmosis", "evaporation",
+    "an ecosystem", "a food chain", "friction", "magnetism", "erosion",
+    "cell division", "digestion", "respiration", "an atom", "a volcano",
+)
+
+NUMBERED_TEMPLATES = (
+    "What is {}?", "Why is {} important?", "How does {} work?",
+    "What are the effects of {}?",
+)
+
+KEYWORD_TEMPLATES = (
+    "Define {}", "Explain {}", "Describe {}", "State two facts about {}",
+    "List the features of {}", "Give an example of {}", "Write a note on {}",
+)
+
+ANSWER_SENTENCES = (
+    "It is a natural process seen in everyday life.",
+    "The process depends on energy from the sun.",
+    "Scientists study it to understand the environment.",
+    "It helps living things survive and grow.",
+    "The effect can be measured with simple tools.",
+    "Each step follows the previous one in order.",
+    "This is taught in most science classes.",
+    "Small changes can have large effects over time.",
+    "The result is useful in many industries.",
+    "It occurs on land as well as in water.",
+)
+
+MCQ_STEMS = (
+    ("Which gas do plants absorb?", ("Oxygen", "Nitrogen", "Carbon dioxide", "Hydrogen")),
+    ("Which planet is closest to the sun?", ("Venus", "Mercury", "Earth", "Mars")),
+    ("Which organ pumps blood?", ("Lungs", "Liver", "Heart", "Kidney")),
+    ("Which state of matter has a fixed shape?", ("Solid", "Liquid", "Gas", "Plasma")),
+    ("Which force pulls objects down?", ("Friction", "Magnetism", "Gravity", "Tension")),
+)
+
+# ==============================
+# QUESTION / ANSWER BLOCKS
+# ==============================
+def make_block(number, rng):
+    """
+    One question with its answer lines, plus the QA pair main6.split_qa
+    should recover from it (numbering stripped, '?' ensured).
+    """
+    kind = rng.choice(("numbered", "keyword", "mcq"))
+    topic = TOPICS[rng.integers(len(TOPICS))]
+
+    if kind == "mcq":
+        stem, options = MCQ_STEMS[rng.integers(len(MCQ_STEMS))]
+        question_line = f"{number}. {stem}"
+        question = stem
+        answer_lines = [f"{letter}. {option}" for letter, option in zip("ABCD", options)]
+    else:
+        if kind == "numbered":
+            template = NUMBERED_TEMPLATES[rng.integers(len(NUMBERED_TEMPLATES))]
+            question = template.format(topic)
+            question_line = f"{number}. {question}"
+        else:
+            template = KEYWORD_TEMPLATES[rng.integers(len(KEYWORD_TEMPLATES))]
+            question = template.format(topic)
+            question_line = question
+            question += "?"
+
+        count = rng.integers(1, 4)
+        picks = rng.choice(len(ANSWER_SENTENCES), size=count, replace=False)
+        answer_lines = [" ".join(ANSWER_SENTENCES[i] for i in picks)]
+
+    return {
+        "question_line": question_line,
+        "answer_lines": answer_lines,
+        "question": question,
+        "answer": " ".join(answer_lines),
+    }
+
+# ==============================
+# RENDERING
+# ==============================
+FONT = cv2.FONT_HERSHEY_SCRIPT_SIMPLEX
+
+# The script font's own space is as narrow as an "i", so words are
+# spaced by this fraction of the line height instead
+SPACE_WIDTH = 0.45
+
+def char_advance(ch, scale, thickness, space_width):
+    if ch == " ":
+        return space_width
+    (w, _), _ = cv2.getTextSize(ch, FONT, scale, thickness)
+    return w
+
+def text_width(text, scale, thickness, space_width):
+    return sum(char_advance(ch, scale, thickness, space_width) for ch in text)
+
+def wrap_line(text, max_width, scale, thickness, space_width):
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if text_width(candidate, scale, thickness, space_width) > max_width and current:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+def draw_jittered(page, text, x, y, scale, thickness, space_width, ink, rng):
+    # Per-character offsets and size changes imitate uneven handwriting.
+    # Sideways jitter stays under a pixel and resized glyphs stay centred
+    # in their advance: otherwise gaps split words ("Desc ribe") or vanish
+    # between them, and the ground truth would no longer match the page.
+    for ch in text:
+        advance = char_advance(ch, scale, thickness, space_width)
+        if ch != " ":
+            char_scale = scale * (1 + rng.normal(0, 0.06))
+            (w, _), _ = cv2.getTextSize(ch, FONT, char_scale, thickness)
+            dx = (advance - w) / 2 + rng.normal(0, 0.25) * scale
+            dy = rng.normal(0, 0.8) * scale * 2
+            cv2.putText(
+                page, ch, (int(round(x + dx)), int(round(y + dy))),
+                FONT, char_scale, ink, thickness, cv2.LINE_AA
+            )
+        x += advance
+
+def degrade(page, rng):
+    h, w = page.shape[:2]
+
+    # Uneven lighting: a random brightness gradient across the page
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    gx, gy = rng.uniform(-0.25, 0.25, size=2)
+    light = 1 + gx * (xx / w - 0.5) + gy * (yy / h - 0.5)
+    page = page.astype(np.float32) * light[..., None]
+
+    # Sensor noise
+    page += rng.normal(0, rng.uniform(3, 12), size=page.shape)
+    page = np.clip(page, 0, 255).astype(np.uint8)
+
+    # Focus blur
+    k = int(rng.choice((1, 3, 5)))
+    if k > 1:
+        page = cv2.GaussianBlur(page, (k, k), 0)
+
+    # Skew from a crooked scan
+    angle = rng.uniform(-2.5, 2.5)
+    M = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    return cv2.warpAffine(page, M, (w, h), borderMode=cv2.BORDER_REPLICATE)
+
+def render_page(page_index, size=PAGE_SIZE, seed=SEED):
+    """
+    Returns (image, ground truth) for one page. Pages are seeded
+    individually, so any page can be regenerated on its own.
+    """
+    rng = np.random.default_rng([seed, page_index])
+    width, height = size
+
+    # Scale text and spacing with the page width
+    scale = width / 1240 * 1.1
+    thickness = max(1, int(round(2 * width / 1240)))
+    line_height = int(42 * width / 1240)
+    space_width = int(line_height * SPACE_WIDTH)
+    margin = int(70 * width / 1240)
+
+    paper = rng.integers(225, 250)
+    page = np.full((height, width, 3), paper, dtype=np.uint8)
+    ink = tuple(int(c) for c in (rng.integers(90, 160), rng.integers(20, 60), rng.integers(0, 40)))
+
+    # Ruled notebook lines
+    for y in range(margin + line_height // 4, height - margin, line_height):
+        cv2.line(page, (0, y), (width, y), (230, 200, 180), 1)
+
+    # Leave room for per-character jitter and skew on the right
+    max_width = int((width - 2 * margin) * 0.9)
+
+    blocks = []
+    lines = []
+    y = margin
+    number = 1
+    while True:
+        block = make_block(number, rng)
+        rendered = wrap_line(block["question_line"], max_width, scale, thickness, space_width)
+        for answer_line in block["answer_lines"]:
+            rendered += wrap_line(answer_line, max_width, scale, thickness, space_width)
+
+        if y + line_height * (len(rendered) + 1) > height - margin:
+            break
+
+        for text in rendered:
+            draw_jittered(page, text, margin, y, scale, thickness, space_width, ink, rng)
+            y += line_height
+        y += line_height // 2
+
+        blocks.append(block)
+        lines += rendered
+        number += 1
+
+    truth = {
+        "text": "\n".join(lines),
+        "qa_pairs": [
+            {"question": f"Q{i}: {b['question']}", "answer": f"A{i}: {b['answer']}"}
+            for i, b in enumerate(blocks, start=1)
+        ],
+    }
+    return degrade(page, rng), truth
+
+def generate_corpus(folder, page_count=PAGE_COUNT, size=PAGE_SIZE, seed=SEED):
+    """
+    Writes page_NNNNN.png with page_NNNNN.txt (raw text, used as ground
+    truth by denoise.py) and page_NNNNN.json (expected QA pairs).
+    """
+    os.makedirs(folder, exist_ok=True)
+    img_paths = []
+    for page_index in range(page_count):
+        image, truth = render_page(page_index, size, seed)
+        stem = os.path.join(folder, f"page_{page_index:05d}")
+
+        cv2.imwrite(stem + ".png", image)
+        with open(stem + ".txt", "w", encoding="utf-8") as f:
+            f.write(truth["text"])
+        with open(stem + ".json", "w", encoding="utf-8") as f:
+            json.dump(truth["qa_pairs"], f, indent=2)
+        img_paths.append(stem + ".png")
+    return img_paths
+
+# ==============================
+# SCORING
+# ==============================
+def strip_label(text):
+    # "Q3: What is osmosis?" -> "what is osmosis?"
+    return re.sub(r"^[QA]\d+:\s*", "", text).strip().lower()
+
+def similar(a, b, threshold=0.8):
+    return difflib.SequenceMatcher(None, a, b).ratio() > threshold
+
+def match_questions(found, expected):
+    """
+    Most questions that can be paired in order by content (an LCS where
+    "equal" means similar), so one extra or missed split does not shift
+    every later pair.
+    """
+    found = [strip_label(qa["question"]) for qa in found]
+    expected = [strip_label(qa["question"]) for qa in expected]
+
+    best = [[0] * (len(expected) + 1) for _ in range(len(found) + 1)]
+    for i in range(1, len(found) + 1):
+        for j in range(1, len(expected) + 1):
+            if similar(found[i - 1], expected[j - 1]):
+                best[i][j] = best[i - 1][j - 1] + 1
+            else:
+                best[i][j] = max(best[i - 1][j], best[i][j - 1])
+    return best[-1][-1]
+
+def score_page(ocr_text, qa_pairs, truth_text, truth_pairs):
+    return {
+        "text_accuracy": difflib.SequenceMatcher(None, ocr_text, truth_text).ratio(),
+        "questions_found": len(qa_pairs),
+        "questions_expected": len(truth_pairs),
+        "questions_matched": match_questions(qa_pairs, truth_pairs),
+    }
+
+def score_corpus(img_paths, texts, split):
+    scores = []
+    for img_path, text in zip(img_paths, texts):
+        stem = os.path.splitext(img_path)[0]
+        with open(stem + ".txt", "r", encoding="utf-8") as f:
+            truth_text = f.read()
+        with open(stem + ".json", "r", encoding="utf-8") as f:
+            truth_pairs = json.load(f)
+        scores.append(score_page(text, split(text), truth_text, truth_pairs))
+
+    expected = sum(s["questions_expected"] for s in scores)
+    return {
+        "pages": len(scores),
+        "text_accuracy": sum(s["text_accuracy"] for s in scores) / max(1, len(scores)),
+        "question_recall": sum(s["questions_matched"] for s in scores) / max(1, expected),
+        "questions_found": sum(s["questions_found"] for s in scores),
+        "questions_expected": expected,
+    }
+
+# ==============================
+# MAIN FUNCTION
+# ==============================
+def main():
+    start = time.perf_counter()
+    img_paths = generate_corpus(SYNTHETIC_FOLDER)
+    print(f"🖊️ Generated {len(img_paths)} pages in {time.perf_counter() - start:.1f}s: {SYNTHETIC_FOLDER}")
+
+    if not RUN_PIPELINE:
+        return
+
+    import main6
+    from scheduler import ocr_pages
+
+    start = time.perf_counter()
+    texts = ocr_pages(
+        img_paths, main6.preprocess_image, main6.recognise_text, main6.ocr_image,
+        denoise=main6.DENOISER
+    )
+    elapsed = time.perf_counter() - start
+
+    score = score_corpus(img_paths, texts, main6.split_qa)
+    print(f"⏱️ {elapsed:.1f}s for {score['pages']} pages ({score['pages'] / elapsed:.2f} pages/s)")
+    print(f"📄 Text accuracy: {score['text_accuracy']:.3f}")
+    print(
+        f"❓ Questions: {score['questions_found']} found, {score['questions_expected']} expected, "
+        f"recall {score['question_recall']:.3f}"
+    )
+
+if __name__ == "__main__":
+    main()
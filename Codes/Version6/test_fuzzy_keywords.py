@@ -0,0 +1,60 @@
+import pytest
+
+from fuzzy_keywords import build_keyword_index, match_keyword
+
+QUESTION_KEYWORDS = (
+    "what", "why", "how", "define", "explain",
+    "state", "list", "describe", "give", "write"
+)
+
+INDEX = build_keyword_index(QUESTION_KEYWORDS, max_distance=1)
+
+
+@pytest.mark.parametrize("line, keyword", [
+    ("Explain the water cycle", "explain"),
+    ("Whats up", "what"),
+    ("Exp1ain the water cycle", "explain"),
+    ("Wnat is osmosis", "what"),
+    ("H0w does it work", "how"),
+    ("Iist three types", "list"),
+    ("Giue an example", "give"),
+    ("5tate the law", "state"),
+    ("Wrlte a note", "write"),
+    ("Defme momentum", "define"),
+    ("Descrihe the process", "describe"),
+    ("Descnbe the process", "describe"),
+])
+def test_misread_keywords_match(line, keyword):
+    assert match_keyword(line, INDEX) == keyword
+
+
+@pytest.mark.parametrize("line", [
+    "Stage 1 is the start",
+    "Stale data is removed",
+    "Stake in the ground",
+    "Stats show growth",
+    "Decline in numbers",
+    "Now the water boils",
+    "N0w the water boils",
+    "Glue the paper down",
+    "G1ue the paper down",
+    "Bow and arrow",
+    "That is correct",
+    "The answer is here",
+    "hot water rises",
+    "Plants use sunlight",
+])
+def test_real_words_do_not_match(line):
+    assert match_keyword(line, INDEX) is None
+
+
+def test_max_distance_is_honoured():
+    # "Dcscnbe" needs two misreads (e -> c, ri -> n)
+    assert match_keyword("Dcscnbe it", build_keyword_index(QUESTION_KEYWORDS, 1)) is None
+    assert match_keyword("Dcscnbe it", build_keyword_index(QUESTION_KEYWORDS, 2)) == "describe"
+
+
+def test_zero_distance_only_uses_free_confusions():
+    index = build_keyword_index(QUESTION_KEYWORDS, max_distance=0)
+    assert match_keyword("Exp1ain it", index) == "explain"
+    assert match_keyword("Descnbe it", index) is None
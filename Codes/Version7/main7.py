@@ -0,0 +1,261 @@
+import hashlib
+import importlib.util
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+# ==============================
+# PATHS
+# ==============================
+CODES_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(CODES_FOLDER, "Version6"))
+
+import main6
+from scheduler import POOL_STARTUP_SECONDS, detect_resources, ocr_pages
+
+IMAGE_FOLDER = r"C:\Users\VGMan\Downloads\Handwritten_OCR_QA\images"
+OUTPUT_FOLDER = r"C:\Users\VGMan\Downloads\Handwritten_OCR_QA\outputs"
+OCR_CACHE_FOLDER = os.path.join(OUTPUT_FOLDER, "ocr_cache")
+RAW_TEXT_FILE = os.path.join(OUTPUT_FOLDER, "raw_text.txt")
+AGREEMENT_FILE = os.path.join(OUTPUT_FOLDER, "agreement_report.txt")
+QA_FILE = os.path.join(OUTPUT_FOLDER, "qa_pairs.txt")
+
+# Write the majority-vote QA pairs in addition to each segmenter's output
+VOTING = True
+
+os.makedirs(OCR_CACHE_FOLDER, exist_ok=True)
+
+# ==============================
+# SEGMENTER REGISTRY
+# ==============================
+# Every segmenter takes page text and returns [(question, answer), ...]
+SEGMENTERS = {}
+
+def register_segmenter(name, split):
+    SEGMENTERS[name] = split
+
+def load_version(relative_path, module_name):
+    # Earlier versions live in sibling folders and share file names,
+    # so load them by path under unique module names
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(CODES_FOLDER, relative_path)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def strip_label(text):
+    # "Q3: What is osmosis?" -> "What is osmosis?"
+    return re.sub(r"^[QA]\d+:\s*", "", text)
+
+def from_dicts(split):
+    def segment(text):
+        return [(strip_label(qa["question"]), strip_label(qa["answer"])) for qa in split(text)]
+    return segment
+
+def from_blocks(split):
+    def segment(text):
+        pairs = []
+        for block in split(text):
+            question, answer = block.rstrip("\n").split("\n", 1)
+            pairs.append((strip_label(question), strip_label(answer)))
+        return pairs
+    return segment
+
+version1 = load_version("Version1/main.py", "qa_version1")
+version2 = load_version("Version2/main2.py", "qa_version2")
+version3 = load_version("Version3/main3.py", "qa_version3")
+version4 = load_version("Version4/main4.py", "qa_version4")
+version5 = load_version("Version5/main5.py", "qa_version5")
+
+register_segmenter("version1", from_dicts(version1.split_qa))
+register_segmenter("version2", version2.split_qa)
+register_segmenter("version3", from_blocks(version3.split_qa))
+register_segmenter("version4", version4.split_qa_mcq)
+# Version5 segments sentence-split text, so apply its cleanup first
+register_segmenter("version5", lambda text: version5.split_qa(version5.clean_text(text)))
+register_segmenter("version6", from_dicts(main6.split_qa))
+
+# ==============================
+# OCR ONCE (CACHED)
+# ==============================
+def cache_path(img_path, denoise):
+    """
+    Cache file for a page, keyed by its full path and the settings that
+    change OCR output, so same-named images in different folders and
+    runs with another denoiser or Tesseract config never share text.
+    """
+    key = "|".join((os.path.abspath(img_path), denoise, main6.OCR_CONFIG))
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(OCR_CACHE_FOLDER, f"{os.path.basename(img_path)}.{digest}.txt")
+
+def load_or_ocr(img_paths):
+    """
+    Returns OCR text per page, reusing cached text for pages whose
+    image has not changed since it was last OCR'd.
+    """
+    # Read the denoiser once and hand the same name to the workers: under
+    # spawn they re-import main6 and would otherwise OCR with its default
+    denoise = main6.DENOISER
+
+    texts = {}
+    missing = []
+    for img_path in img_paths:
+        cached = cache_path(img_path, denoise)
+        if os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(img_path):
+            with open(cached, "r", encoding="utf-8") as f:
+                texts[img_path] = f.read()
+        else:
+            missing.append(img_path)
+
+    print(f"📦 {len(img_paths) - len(missing)} page(s) from OCR cache, {len(missing)} to OCR")
+    fresh = ocr_pages(
+        missing, main6.preprocess_image, main6.recognise_text, main6.ocr_image,
+        denoise=denoise
+    )
+    for img_path, text in zip(missing, fresh):
+        with open(cache_path(img_path, denoise), "w", encoding="utf-8") as f:
+            f.write(text)
+        texts[img_path] = text
+
+    return [texts[img_path] for img_path in img_paths]
+
+# ==============================
+# SEGMENT MANY
+# ==============================
+def segment_page(text):
+    return {name: split(text) for name, split in SEGMENTERS.items()}
+
+def segment_pages(texts):
+    if not texts:
+        return []
+
+    # Time the first page: regex splitting is usually far cheaper than
+    # starting workers that re-import every version (cv2, pytesseract)
+    start = time.perf_counter()
+    first = segment_page(texts[0])
+    page_time = time.perf_counter() - start
+
+    rest = texts[1:]
+    workers = min(detect_resources()["cpus"], len(rest))
+    if workers <= 1 or page_time * len(rest) < POOL_STARTUP_SECONDS * workers:
+        return [first] + [segment_page(text) for text in rest]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [first] + list(pool.map(segment_page, rest, chunksize=max(1, len(rest) // (workers * 4))))
+
+# ==============================
+# AGREEMENT AND VOTING
+# ==============================
+def clean_question(question):
+    # Versions 2 and 4 keep the "1." prefix, the others strip it
+    question = re.sub(r"^(\d+\.|q\d+)\s*", "", question.strip(), flags=re.IGNORECASE)
+    return question.rstrip("?").strip() + "?"
+
+def question_key(question):
+    return " ".join(re.findall(r"[a-z0-9]+", clean_question(question).lower()))
+
+def agreement(results):
+    """
+    Pairwise Jaccard similarity of the question sets each segmenter found.
+    """
+    keys = {name: {question_key(q) for q, _ in pairs} for name, pairs in results.items()}
+
+    pairwise = {}
+    for a, b in combinations(keys, 2):
+        union = keys[a] | keys[b]
+        pairwise[(a, b)] = len(keys[a] & keys[b]) / len(union) if union else 1.0
+
+    return {
+        "counts": {name: len(pairs) for name, pairs in results.items()},
+        "pairwise": pairwise,
+        "mean": sum(pairwise.values()) / len(pairwise) if pairwise else 1.0,
+    }
+
+def vote(results):
+    """
+    Keeps questions found by a majority of segmenters, ordered by their
+    average relative position; each takes its most common answer.
+    Ties go to the earlier registered segmenter.
+    """
+    quorum = len(results) // 2 + 1
+    votes = {}
+
+    for pairs in results.values():
+        seen = set()
+        for i, (q, a) in enumerate(pairs):
+            key = question_key(q)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+
+            v = votes.setdefault(key, {"positions": [], "questions": Counter(), "answers": Counter()})
+            v["positions"].append(i / len(pairs))
+            v["questions"][clean_question(q)] += 1
+            v["answers"][a.strip()] += 1
+
+    accepted = [v for v in votes.values() if len(v["positions"]) >= quorum]
+    accepted.sort(key=lambda v: sum(v["positions"]) / len(v["positions"]))
+
+    return [
+        (v["questions"].most_common(1)[0][0], v["answers"].most_common(1)[0][0])
+        for v in accepted
+    ]
+
+# ==============================
+# OUTPUT
+# ==============================
+def write_qa(path, qa_pairs):
+    with open(path, "w", encoding="utf-8") as f:
+        for i, (q, a) in enumerate(qa_pairs, 1):
+            f.write(f"Q{i}: {q}\n")
+            f.write(f"A{i}: {a}\n\n")
+
+def write_agreement(path, files, reports):
+    with open(path, "w", encoding="utf-8") as f:
+        for file, report in zip(files, reports):
+            f.write(f"{file}: mean agreement {report['mean']:.2f}\n")
+            counts = ", ".join(f"{name}={n}" for name, n in report["counts"].items())
+            f.write(f"  questions: {counts}\n")
+            for (a, b), score in report["pairwise"].items():
+                f.write(f"  {a} vs {b}: {score:.2f}\n")
+            f.write("\n")
+
+# ==============================
+# MAIN FUNCTION
+# ==============================
+def main():
+    files = [
+        file for file in sorted(os.listdir(IMAGE_FOLDER))
+        if file.lower().endswith((".png", ".jpg", ".jpeg"))
+    ]
+    img_paths = [os.path.join(IMAGE_FOLDER, file) for file in files]
+
+    # OCR once
+    texts = load_or_ocr(img_paths)
+    with open(RAW_TEXT_FILE, "w", encoding="utf-8") as f:
+        f.write("\n".join(texts) + "\n")
+
+    # Segment many
+    results = segment_pages(texts)
+
+    for name in SEGMENTERS:
+        qa_pairs = [pair for page in results for pair in page[name]]
+        write_qa(os.path.join(OUTPUT_FOLDER, f"qa_pairs_{name}.txt"), qa_pairs)
+
+    write_agreement(AGREEMENT_FILE, files, [agreement(page) for page in results])
+
+    print("✅ Segmented with:", ", ".join(SEGMENTERS))
+    print(f"📄 Raw OCR text: {RAW_TEXT_FILE}")
+    print(f"📄 Agreement report: {AGREEMENT_FILE}")
+
+    if VOTING:
+        write_qa(QA_FILE, [pair for page in results for pair in vote(page)])
+        print(f"📄 Ensemble QA pairs: {QA_FILE}")
+
+if __name__ == "__main__":
+    main()